@@ -17,7 +17,11 @@ from argos.argos import argos
 from edge_sim_py.heuristics.never_migrate import never_migrate
 from edge_sim_py.heuristics.follow_vehicle import follow_vehicle
 
+# Helper methods
+from argos.helper_methods import PerStepContext, compute_delay_matrix, count_trusted_users
+
 # Python libraries
+import argparse
 import random
 import time
 import typing
@@ -45,7 +49,7 @@ def add_trusted_servers():
     providers_trusted_by_users = uniform(n_items=User.count(), valid_values=providers, shuffle_distribution=True)
     for i, user in enumerate(User.all()):
         trusted_provider = providers_trusted_by_users[i]
-        trusted_servers = [edge_server for edge_server in EdgeServer.all() if edge_server.provider == trusted_provider]
+        trusted_servers = {edge_server for edge_server in EdgeServer.all() if edge_server.provider == trusted_provider}
         user.trusted_servers = trusted_servers
 
 
@@ -62,8 +66,15 @@ def run(self, algorithm: typing.Callable):
     # Adding a reference to the network topology inside the Simulator instance
     self.topology = Topology.first()
 
+    # Precomputing the delay between all pairs of base stations. Links' delay is not modified throughout the
+    # simulation (only their demand is), so a single all-pairs computation serves every simulation time step
+    delay_matrix = compute_delay_matrix(topology=self.topology)
+
+    # Counting how many users trust each edge server (users' trust levels do not change during the simulation)
+    trusted_users = count_trusted_users()
+
     # Creating an empty list to accommodate the simulation metrics
-    algorithm_name = f"{str(algorithm).split(' ')[1]}-{time.time()}"
+    algorithm_name = f"{algorithm.__name__}-{time.time()}"
     self.metrics[algorithm_name] = []
 
     # Storing original objects state
@@ -74,6 +85,9 @@ def run(self, algorithm: typing.Callable):
         # Updating system state according to the new simulation time step
         self.update_state(step=simulation_step)
 
+        # Creating the context shared by the algorithm's methods during the current simulation step
+        self.context = PerStepContext(delay_matrix=delay_matrix, trusted_users=trusted_users)
+
         # Collecting metrics for the current simulation step
         self.collect_metrics(algorithm=algorithm_name)
 
@@ -94,42 +108,48 @@ def collect_metrics(self, algorithm: str):
         algorithm (str): Name of the algorithm being executed.
     """
     sla_violations = 0
-    services_on_trusted_servers = 0
     privacy_violations = 0
     migrations = []
 
     # Computing user-related metrics (SLA violations)
     for user in User.all():
+        delays = user.delays
+        delay_slas = user.delay_slas
         for app in user.applications:
-            if user.delays[app] > user.delay_slas[app]:
+            if delays[app] > delay_slas[app]:
                 sla_violations += 1
 
     # Computing application-related metrics (Privacy violations)
     for application in Application.all():
-        user = application.users[0]
-        services_on_untrusted_servers = 0
-        for service in application.services:
-            if service.server not in user.trusted_servers and service.privacy_requirement:
-                services_on_untrusted_servers += 1
-
-        if services_on_untrusted_servers > 0:
+        trusted_servers = application.users[0].trusted_servers
+        if any(
+            service.server not in trusted_servers and service.privacy_requirement for service in application.services
+        ):
             privacy_violations += 1
 
-    # Computing services-related metrics (Services on trusted servers, Privacy violations, Number of migrations)
-    for service in Service.all():
-        user = service.application.users[0]
-        if service.server in user.trusted_servers:
-            services_on_trusted_servers += 1
+    # Computing services-related metrics (Services on trusted servers)
+    services_on_trusted_servers = sum(
+        service.server in service.application.users[0].trusted_servers for service in Service.all()
+    )
 
+    # Computing services-related metrics (Number of migrations)
+    for service in Service.all():
         # As the metrics collection method is called before the algorithm execution, we need to compute the number of
-        # migrations performed in the previous step.
-        for migration in service.migrations:
+        # migrations performed in the previous step. Migrations are stored chronologically, so we walk the service's
+        # migration history backwards and stop as soon as we reach migrations performed before the previous step.
+        recent_migrations = []
+        for migration in reversed(service.migrations):
+            if migration["step"] < self.current_step - 1:
+                break
+
             if (
                 migration["step"] == self.current_step - 1
                 or self.current_step == self.simulation_steps
                 and migration["step"] == self.current_step
             ):
-                migrations.append(migration["duration"])
+                recent_migrations.append(migration["duration"])
+
+        migrations.extend(reversed(recent_migrations))
 
     # Creating the structure to accommodate simulation metrics
     self.metrics[algorithm].append(
@@ -175,7 +195,12 @@ def show_results(self):
         print(f"    Services on Trusted Servers: {sum(services_on_trusted_servers)} - {services_on_trusted_servers}")
 
 
-def main():
+def main(dataset_path: str):
+    """Runs the simulation with each migration strategy and displays the results.
+
+    Args:
+        dataset_path (str): Path of the dataset file that describes the simulated scenario.
+    """
     random.seed(1)
 
     # Overriding the methods that collect and display simulation results to comprehend privacy-related metrics
@@ -187,7 +212,7 @@ def main():
     simulator = Simulator()
 
     # Loading the dataset
-    simulator.load_dataset(input_file="datasets/closer2022.json")
+    simulator.load_dataset(input_file=dataset_path)
 
     # Extending the simulated objects with privacy/trustworthiness attributes
     add_privacy_requirements()
@@ -204,4 +229,13 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Parsing command line arguments
+    parser = argparse.ArgumentParser(description="Simulates privacy-aware service migration strategies.")
+    parser.add_argument(
+        "--dataset",
+        default="datasets/closer2022.json",
+        help="Path of the dataset file that describes the simulated scenario (default: %(default)s).",
+    )
+    args = parser.parse_args()
+
+    main(dataset_path=args.dataset)
@@ -1,5 +1,4 @@
 # EdgeSimPy components
-from edge_sim_py.components.user import User
 from edge_sim_py.components.edge_server import EdgeServer
 from edge_sim_py.components.application import Application
 
@@ -10,8 +9,19 @@ from argos.helper_methods import get_delay
 def argos():
     """Privacy-aware service migration strategy for edge computing environments."""
 
-    apps = [app for app in Application.all() if app.users[0].delays[app] > app.users[0].delay_slas[app]]
-    apps = sorted(apps, key=lambda app: app.users[0].delay_slas[app] - app.users[0].delays[app])
+    # Gathering applications whose SLA is violated along with the difference between their SLA and delay
+    slacks = {}
+    for app in Application.all():
+        user = app.users[0]
+        slack = user.delay_slas[app] - user.delays[app]
+        if slack < 0:
+            slacks[app] = slack
+
+    # There is nothing to do in steps where all applications meet their SLA
+    if len(slacks) == 0:
+        return
+
+    apps = sorted(slacks, key=slacks.get)
 
     for app in apps:
         user = app.users[0]
@@ -35,7 +45,8 @@ def argos():
 
 
 def get_host_candidates(user: object) -> list:
-    """Get list of host candidates for hosting services of a given user.
+    """Get list of host candidates for hosting services of a given user. As host candidates' metadata only change when
+    the user moves, the list is computed once per simulation time step and reused for all the user's applications.
 
     Args:
         user (object): User object.
@@ -43,12 +54,17 @@ def get_host_candidates(user: object) -> list:
     Returns:
         list: List of host candidates.
     """
+    context = user.simulator.context
+
+    if user in context.host_candidates:
+        return context.host_candidates[user]
+
     host_candidates = []
 
     for edge_server in EdgeServer.all():
         delay = get_delay(origin=user, target=edge_server)
-        trusted_users = sum([1 for u in User.all() if edge_server in u.trusted_servers and u != user])
         is_trusted = 1 if edge_server in user.trusted_servers else 0
+        trusted_users = context.trusted_users[edge_server] - is_trusted
 
         host_candidates.append(
             {
@@ -59,4 +75,6 @@ def get_host_candidates(user: object) -> list:
             }
         )
 
+    context.host_candidates[user] = host_candidates
+
     return host_candidates
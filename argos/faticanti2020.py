@@ -24,6 +24,10 @@ def faticanti2020():
         key=lambda service: (service.application.services.index(service), service.application.network_demand),
     )
 
+    # Delays between users and edge servers do not change while the heuristic runs. Hence, we compute them once for each
+    # user and reuse them when sorting edge servers for each service of that user's application
+    delays_to_edge_servers = {}
+
     for service in services:
         # Gathering service's application and current application's delay
         app = service.application
@@ -36,12 +40,17 @@ def faticanti2020():
         # violated so that the heuristic avoids performing unnecessary migrations. Without such modification, the
         # heuristic would try to migrate services in all time steps, which would lead to poor results in our scenario.
         if delay > sla:
+            if user not in delays_to_edge_servers:
+                delays_to_edge_servers[user] = {s: get_delay(origin=user, target=s) for s in EdgeServer.all()}
+            delays = delays_to_edge_servers[user]
+            trusted_servers = user.trusted_servers
+
             # Sorting edge servers by: trustworthiness, distance from user (in terms of delay), and free resources.
             edge_servers = sorted(
                 EdgeServer.all(),
                 key=lambda s: (
-                    -(s in user.trusted_servers),
-                    get_delay(origin=user, target=s),
+                    -(s in trusted_servers),
+                    delays[s],
                     s.capacity - s.demand,
                 ),
             )
@@ -1,7 +1,58 @@
+# EdgeSimPy components
+from edge_sim_py.components.user import User
+from edge_sim_py.components.edge_server import EdgeServer
+
 # Python libraries
 import networkx as nx
 
 
+class PerStepContext:
+    """Class that groups the data shared by the migration strategies' methods within a simulation time step."""
+
+    def __init__(self, delay_matrix: dict, trusted_users: dict) -> object:
+        """Creates a PerStepContext object.
+
+        Args:
+            delay_matrix (dict): Delay between all pairs of base stations (see 'compute_delay_matrix').
+            trusted_users (dict): Number of users that trust each edge server (see 'count_trusted_users').
+
+        Returns:
+            object: Created PerStepContext object.
+        """
+        self.delay_matrix = delay_matrix
+        self.trusted_users = trusted_users
+
+        # Host candidates gathered for each user during the simulation time step
+        self.host_candidates = {}
+
+
+def compute_delay_matrix(topology: object) -> dict:
+    """Computes the distance (in terms of delay) between all pairs of base stations in the network topology.
+
+    Args:
+        topology (object): Network topology.
+
+    Returns:
+        dict: Dictionary indexed by origin and target base stations with the delay between them.
+    """
+    return dict(nx.all_pairs_dijkstra_path_length(G=topology, weight="delay"))
+
+
+def count_trusted_users() -> dict:
+    """Counts how many users trust each edge server.
+
+    Returns:
+        dict: Dictionary indexed by edge servers with the number of users that trust them.
+    """
+    trusted_users = {edge_server: 0 for edge_server in EdgeServer.all()}
+
+    for user in User.all():
+        for edge_server in user.trusted_servers:
+            trusted_users[edge_server] += 1
+
+    return trusted_users
+
+
 def get_delay(origin: object, target: object) -> int:
     """Gets the distance (in terms of delay) between two elements (origin and target).
 
@@ -13,8 +64,8 @@ def get_delay(origin: object, target: object) -> int:
         int: Delay between origin and target.
     """
     topology = origin.simulator.topology
+    delay_matrix = origin.simulator.context.delay_matrix
 
-    path = nx.shortest_path(G=topology, source=origin.base_station, target=target.base_station, weight="delay")
-    delay = topology.calculate_path_delay(path=path) + topology.wireless_delay
+    delay = delay_matrix[origin.base_station][target.base_station] + topology.wireless_delay
 
     return delay
@@ -75,12 +75,14 @@ service_builder.create_objects(n_objects=n_services)
 service_demands = uniform(n_items=n_services, valid_values=[10, 20, 30, 40, 50], shuffle_distribution=True)
 service_builder.set_demand_all_services(demand_values=service_demands)
 
+# Services are linked to applications in the order they were created, so each application gets a slice of the list
+first_service = 0
 for index, application in enumerate(Application.all()):
-    for _ in range(services_per_application[index]):
-        service = next((service for service in Service.all() if service.application is None), None)
-        if service is not None:
-            service.application = application
-            application.services.append(service)
+    last_service = first_service + services_per_application[index]
+    for service in Service.all()[first_service:last_service]:
+        service.application = application
+        application.services.append(service)
+    first_service = last_service
 
 # Defines the initial service placement scheme
 first_fit()
@@ -118,6 +120,11 @@ user_builder.set_pathway_mobility_all_users(
 
 users_per_application = uniform(n_items=n_users, valid_values=[1], shuffle_distribution=True)
 
+# Applications only gain users. Hence, once an application has more than "i" users, it is never again chosen as the
+# i-th application of a user. This allows us to keep, for each "i", the position of the first available application
+first_available_application = {}
+applications = Application.all()
+
 for index, user in enumerate(User.all()):
     delay_slas = uniform(
         n_items=users_per_application[index],
@@ -126,10 +133,12 @@ for index, user in enumerate(User.all()):
     )
 
     for i in range(users_per_application[index]):
-        application = next(
-            (application for application in Application.all() if len(application.users) <= i),
-            None,
-        )
+        position = first_available_application.get(i, 0)
+        while position < len(applications) and len(applications[position].users) > i:
+            position += 1
+        first_available_application[i] = position
+
+        application = applications[position] if position < len(applications) else None
         if application is not None:
             application.users.append(user)
             user.applications.append(application)
@@ -151,64 +160,67 @@ for index, user in enumerate(User.all()):
                     else communication_chain[j + 1].server.base_station
                 )
                 # Finding the best communication path
-                path = Topology.first().get_shortest_path(
+                path = topology.get_shortest_path(
                     origin=origin,
                     target=target,
                     user=user,
                     app=application,
                 )
-                # Adding the best path found to the communication path
-                user.communication_paths[application].extend(path)
-
-            # Removing duplicated entries in the communication path to avoid NetworkX crashes
-            user.communication_paths[application] = Topology.first().remove_path_duplicates(
-                path=user.communication_paths[application]
-            )
+                # Adding the best path found to the communication path. As each path starts where the previous one
+                # ends, we skip the first node of every path but the first to avoid duplicated entries (which would
+                # lead to NetworkX crashes) in the communication path
+                user.communication_paths[application].extend(path if j == 0 else path[1:])
 
             # Computing the new demand of chosen links
-            Topology.first().allocate_communication_path(
+            topology.allocate_communication_path(
                 communication_path=user.communication_paths[application],
                 app=application,
             )
 
             # Initializes the application's delay with the time it takes to communicate its client and a base station
-            delay = Topology.first().wireless_delay
+            delay = topology.wireless_delay
 
-            # Adding the communication path delay to the application's delay
+            # Adding the communication path delay to the application's delay. As the communication path has no
+            # duplicated entries, we sum the delay of its links instead of using 'calculate_path_delay'
             communication_path = user.communication_paths[application]
-            delay += Topology.first().calculate_path_delay(path=communication_path)
+            delay += sum(
+                topology[node1][node2]["delay"] for node1, node2 in zip(communication_path, communication_path[1:])
+            )
 
             # Updating application delay inside user's 'applications' attribute
             user.delays[application] = delay
 
 if VERBOSE:
-    print("\nBase Stations:")
+    # Gathering the summary lines so that the whole summary is written at once instead of line by line
+    summary = ["\nBase Stations:"]
     for base_station in BaseStation.all():
-        print(f"    {base_station}. Coordinates: {base_station.coordinates}.")
+        summary.append(f"    {base_station}. Coordinates: {base_station.coordinates}.")
 
-    print("\n\nEdge Servers:")
+    summary.append("\n\nEdge Servers:")
     for edge_server in EdgeServer.all():
-        print(
+        summary.append(
             f"    {edge_server}. Coordinates: {edge_server.coordinates}. Capacity: {edge_server.capacity}. Base Station: {edge_server.base_station} ({edge_server.base_station.coordinates})"
         )
 
-    print("\n\nApplications:")
+    summary.append("\n\nApplications:")
     for application in Application.all():
-        print(f"    {application}. Network Demand: {application.network_demand}.")
+        summary.append(f"    {application}. Network Demand: {application.network_demand}.")
         for service in application.services:
-            print(f"        {service}. Demand: {service.demand}. Server: {service.server}")
+            summary.append(f"        {service}. Demand: {service.demand}. Server: {service.server}")
 
-    print("\n\nUsers:")
+    summary.append("\n\nUsers:")
     for user in User.all():
-        print(
+        summary.append(
             f"    {user}. Coordinates: {user.coordinates}. Base Station: {user.base_station} ({user.base_station.coordinates})"
         )
 
         for app in user.applications:
-            print(
+            summary.append(
                 f"        {app}. SLA: {user.delay_slas[app]}. Delay {user.delays[app]}. Communication Path: {len(user.communication_paths[app])}"
             )
 
+    print("\n".join(summary))
+
 
 ##########################
 ## CREATING OUTPUT FILE ##
@@ -285,17 +297,15 @@ dataset["services"] = [
 ]
 
 network_links = []
-for index, link in enumerate(Topology.first().edges(data=True)):
+for index, (node1, node2, link) in enumerate(topology.edges(data=True)):
     nodes = [
-        {"type": "BaseStation", "id": link[0].id},
-        {"type": "BaseStation", "id": link[1].id},
+        {"type": "BaseStation", "id": node1.id},
+        {"type": "BaseStation", "id": node2.id},
     ]
-    delay = Topology.first()[link[0]][link[1]]["delay"]
-    bandwidth = Topology.first()[link[0]][link[1]]["bandwidth"]
-    network_links.append({"id": index + 1, "nodes": nodes, "delay": delay, "bandwidth": bandwidth})
+    network_links.append({"id": index + 1, "nodes": nodes, "delay": link["delay"], "bandwidth": link["bandwidth"]})
 
 dataset["network"] = {
-    "wireless_delay": Topology.first().wireless_delay,
+    "wireless_delay": topology.wireless_delay,
     "links": network_links,
 }
 